@@ -0,0 +1,115 @@
+"""On-disk caching of parsed ODiSI TSV exports.
+
+The TSV files exported by the ODiSI software are immutable experiment
+outputs, so repeated reads can be served from a Parquet copy of the
+parsed data, which loads much faster than re-parsing the text file. The
+cache is stored in two sidecar files next to the original TSV and is
+keyed on its size and modification time, so it is rebuilt automatically
+whenever the file changes.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+from numpy.typing import NDArray
+
+# Bump whenever the layout of the cached payload changes
+_CACHE_VERSION = 1
+
+
+def _sidecar_paths(path: Path) -> tuple[Path, Path]:
+    return (
+        path.with_name(path.name + ".parquet"),
+        path.with_name(path.name + ".meta.json"),
+    )
+
+
+def _cache_key(path: Path) -> list[int]:
+    st = path.stat()
+    return [st.st_mtime_ns, st.st_size]
+
+
+def load_cached(path: Path) -> tuple[pl.DataFrame, NDArray, dict] | None:
+    """Load the cached payload for the given TSV file.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the original TSV file (not to the sidecar files).
+
+    Returns
+    -------
+    cached : tuple[pl.DataFrame, NDArray, dict] | None
+        The parsed data, x-coordinates and remaining payload (metadata,
+        gages and segments), or None when no cache exists or it does not
+        match the current file anymore.
+
+    """
+    f_data, f_meta = _sidecar_paths(path)
+
+    if not (f_data.exists() and f_meta.exists()):
+        return None
+
+    try:
+        payload = json.loads(f_meta.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    # Discard stale caches
+    if (
+        payload.get("version") != _CACHE_VERSION
+        or payload.get("key") != _cache_key(path)
+    ):
+        return None
+
+    df = pl.read_parquet(f_data)
+    x = np.asarray(payload["x"])
+
+    return df, x, payload
+
+
+def store_cached(
+    path: Path,
+    df: pl.DataFrame,
+    x: NDArray,
+    metadata: dict,
+    with_gages: bool,
+    gages: dict,
+    segments: dict,
+):
+    """Write the parsed data for the given TSV file to the sidecar files.
+
+    Parameters
+    ----------
+    path : Path
+        Path to the original TSV file (not to the sidecar files).
+    df : pl.DataFrame
+        The parsed sensor data.
+    x : NDArray
+        The x-coordinates along the sensor.
+    metadata : dict
+        The metadata of the experiment.
+    with_gages : bool
+        Whether the file contains gages/segments.
+    gages : dict
+        Mapping of gage labels to column numbers.
+    segments : dict
+        Mapping of segment labels to (start, end) column numbers.
+
+    """
+    f_data, f_meta = _sidecar_paths(path)
+
+    payload = {
+        "version": _CACHE_VERSION,
+        "key": _cache_key(path),
+        "x": x.tolist(),
+        "metadata": metadata,
+        "with_gages": with_gages,
+        "gages": gages,
+        "segments": segments,
+    }
+
+    df.write_parquet(f_data)
+    f_meta.write_text(json.dumps(payload))
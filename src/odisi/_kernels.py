@@ -0,0 +1,50 @@
+"""Numerical kernels for the interpolation hot path.
+
+If numba is installed (see the `numba` extra), the column loop is
+JIT-compiled and parallelized across columns; otherwise a plain NumPy
+loop is used, which yields the exact same results.
+"""
+
+import numpy as np
+from numpy.typing import NDArray
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def interp_columns(
+    t_new: NDArray, t_data: NDArray, y_data: NDArray
+) -> NDArray:
+    """Linearly interpolate every column of `y_data` at `t_new`.
+
+    Parameters
+    ----------
+    t_new : NDArray
+        Timestamps at which the columns are evaluated.
+    t_data : NDArray
+        Timestamps of the measured data (must be increasing).
+    y_data : NDArray
+        Two-dimensional array with one measured signal per column.
+
+    Returns
+    -------
+    y_new : NDArray
+        Array of shape `(len(t_new), y_data.shape[1])` with the
+        interpolated columns.
+
+    """
+    y_new = np.empty((t_new.shape[0], y_data.shape[1]))
+    _interp_loop(t_new, t_data, y_data, y_new)
+    return y_new
+
+
+def _interp_loop(t_new, t_data, y_data, y_new):
+    for j in prange(y_data.shape[1]):
+        y_new[:, j] = np.interp(t_new, t_data, y_data[:, j])
+
+
+if njit is not None:
+    _interp_loop = njit(cache=True, parallel=True)(_interp_loop)
@@ -1,11 +1,49 @@
+from dataclasses import dataclass
 from datetime import timedelta
 
 import numpy as np
 import polars as pl
 from numpy.typing import NDArray
 
+from odisi._kernels import interp_columns
 from odisi.time_callibration import calibrate_timedelta
-from odisi.utils import timedelta_sec
+
+# Reused expression for the timestamp column, so that the hot code paths do
+# not rebuild it on every call
+_TIME = pl.col("time")
+
+
+@dataclass(slots=True)
+class OdisiMetadata:
+    """Pre-parsed metadata of the experiment.
+
+    Attributes
+    ----------
+    channel : int
+        Number of the channel.
+    rate : float
+        Measurement rate in Hz.
+    gage_pitch : float
+        Gage pitch in mm.
+    raw : dict
+        The raw metadata entries from the file header.
+
+    """
+
+    channel: int
+    rate: float
+    gage_pitch: float
+    raw: dict
+
+    @classmethod
+    def from_raw(cls, raw: dict) -> "OdisiMetadata":
+        """Parse the typed fields from the raw header entries once."""
+        return cls(
+            channel=int(raw["Channel"]),
+            rate=float(raw["Measurement Rate per Channel"].split(" ")[0]),
+            gage_pitch=float(raw["Gage Pitch (mm)"]),
+            raw=raw,
+        )
 
 
 class OdisiResult:
@@ -17,12 +55,12 @@ class OdisiResult:
         A dataframe with the data of the experiment.
     x : ArrayLike
         The measurement positions along the sensor.
-    gages : list[str]
-        A list containing the name of each gage.
-    segments : list[str]
-        A list containing the name of each segment.
-    metadata : dict
-        Dictionary containing the metadata of the experiment.
+    gages : tuple[str, ...]
+        The name of each gage.
+    segments : tuple[str, ...]
+        The name of each segment.
+    metadata : obj:`OdisiMetadata`
+        The metadata of the experiment.
     channel : int
         Number of the channel.
     rate : float
@@ -31,14 +69,32 @@ class OdisiResult:
 
     """
 
+    __slots__ = (
+        "_data",
+        "_gages",
+        "_segments",
+        "_x",
+        "_time_cache",
+        "_gages_cache",
+        "_segments_cache",
+        "_metadata",
+        "_channel",
+        "_rate",
+        "_gage_pitch",
+    )
+
     def __init__(self, data, x, metadata):
         self._data: pl.DataFrame = data
         self._gages: dict[str, int] = {}
-        self._segments: dict[str, tuple[int, int]] = {}
+        self._segments: dict[str, NDArray] = {}
         self._x: NDArray = x
-        self._channel: int = int(metadata["Channel"])
-        self._rate: float = float(metadata["Measurement Rate per Channel"][:-3])
-        self._gage_pitch: float = float(metadata["Gage Pitch (mm)"])
+        self._time_cache: NDArray | None = None
+        self._gages_cache: tuple[str, ...] | None = None
+        self._segments_cache: tuple[str, ...] | None = None
+        self._metadata: OdisiMetadata = metadata
+        self._channel: int = metadata.channel
+        self._rate: float = metadata.rate
+        self._gage_pitch: float = metadata.gage_pitch
 
     @property
     def data(self) -> pl.DataFrame:
@@ -48,6 +104,10 @@ class OdisiResult:
     def x(self) -> NDArray:
         return self._x
 
+    @property
+    def metadata(self) -> OdisiMetadata:
+        return self._metadata
+
     @property
     def channel(self):
         return self._channel
@@ -62,15 +122,25 @@ class OdisiResult:
 
     @property
     def time(self) -> NDArray:
-        return self.data.select(pl.col("time")).to_numpy().flatten()
+        # Cache the converted array, since the data only changes through
+        # `shift_time` and `interpolate` (which invalidate the cache).
+        if self._time_cache is None:
+            self._time_cache = self.data.get_column("time").to_numpy()
+        return self._time_cache
 
     @property
-    def gages(self) -> list[str]:
-        return list(self._gages.keys())
+    def gages(self) -> tuple[str, ...]:
+        # The labels are fixed after construction, so cache the tuple
+        if self._gages_cache is None:
+            self._gages_cache = tuple(self._gages)
+        return self._gages_cache
 
     @property
-    def segments(self) -> list[str]:
-        return list(self._segments.keys())
+    def segments(self) -> tuple[str, ...]:
+        # The labels are fixed after construction, so cache the tuple
+        if self._segments_cache is None:
+            self._segments_cache = tuple(self._segments)
+        return self._segments_cache
 
     def shift_time(self, t: timedelta):
         """Shift the datetime information by `t`.
@@ -81,9 +151,12 @@ class OdisiResult:
             Time shifted.
 
         """
-        self._data = self._data.with_columns(pl.col("time") + t)
+        self._data = self._data.with_columns(_TIME + t)
+        self._time_cache = None
 
-    def get_gage(self, label: str, with_time: bool = False) -> pl.DataFrame:
+    def get_gage(
+        self, label: str, with_time: bool = False, lazy: bool = False
+    ) -> pl.DataFrame | pl.LazyFrame:
         """Get data corresponding to the given gage.
 
         Parameters
@@ -92,26 +165,38 @@ class OdisiResult:
             The label of the gage.
         with_time : bool
             Whether a column with the time should also be returned in the dataframe.
+        lazy : bool
+            Whether a LazyFrame should be returned instead, so that further
+            operations can be optimized by the query engine before collecting.
 
         Returns
         -------
-        df : pl.DataFrame
+        df : pl.DataFrame | pl.LazyFrame
             Dataframe with the data corresponding to the gage.
 
         """
-        # Check that the label exists
-        if label not in self.gages:
+        # Check that the label exists (dict lookup, avoids building the list
+        # of labels on every call)
+        if label not in self._gages:
             raise KeyError("The given gage label does not exist.")
 
-        ix_gage = self._data.columns[self._gages[label]]
-        if with_time:
-            return self._data.select(pl.col(["time", ix_gage]))
+        # Select the column by position, so that the list of column names
+        # does not need to be materialized
+        ix_gage = self._gages[label]
+        cols = pl.nth([0, ix_gage]) if with_time else pl.nth(ix_gage)
+
+        if lazy:
+            return self._data.lazy().select(cols)
         else:
-            return self._data.select(pl.col(ix_gage))
+            return self._data.select(cols)
 
     def get_segment(
-        self, label: str, with_time: bool = False, x_along_sensor: bool = False
-    ) -> tuple[pl.DataFrame, NDArray]:
+        self,
+        label: str,
+        with_time: bool = False,
+        x_along_sensor: bool = False,
+        lazy: bool = False,
+    ) -> tuple[pl.DataFrame | pl.LazyFrame, NDArray]:
         """Get data corresponding to the given segment.
 
         Parameters
@@ -123,34 +208,42 @@ class OdisiResult:
         x_along_sensor : bool
             Whether the returned `x` should contain the original x-coordinates within
             the fiber.
+        lazy : bool
+            Whether a LazyFrame should be returned instead, so that further
+            operations can be optimized by the query engine before collecting.
 
         Returns
         -------
-        df : pl.DataFrame
+        df : pl.DataFrame | pl.LazyFrame
             Dataframe with the data corresponding to the segment.
         x : NDArray
             Relative x-coordinates for the segment.
 
         """
-        # Check that the label exists
-        if label not in self.segments:
+        # Check that the label exists (dict lookup, avoids building the list
+        # of labels on every call)
+        if label not in self._segments:
             raise KeyError("The given segment label does not exist.")
 
-        # Get start and end indices delimiting the column range for the segment
-        s, e = self._segments[label]
-        # Get the column name of the corresponding columns
-        ix_segment = self._data.columns[s : e + 1]
+        # Get the column indices corresponding to the segment
+        ix = self._segments[label]
 
         if x_along_sensor:
-            x = self.x[s - 1 : e]
+            x = self.x[ix - 1]
         else:
             # Generate x-axis (starting from zero)
-            x = self.x[s - 1 : e] - self.x[s - 1]
+            x = self.x[ix - 1] - self.x[ix[0] - 1]
+
+        # Select the columns by position, so that the list of column names
+        # does not need to be materialized
+        if lazy:
+            cols = [0, *ix.tolist()] if with_time else ix.tolist()
+            return self._data.lazy().select(pl.nth(cols)), x
 
         if with_time:
-            return self._data.select(pl.col(["time", *ix_segment])), x
+            return self._data[:, [0, *ix]], x
         else:
-            return self._data.select(pl.col(ix_segment)), x
+            return self._data[:, ix], x
 
     def reverse_segment(self, name: str):
         """Reverse the direction of the segment.
@@ -168,10 +261,10 @@ class OdisiResult:
 
     def clip_time(self, data: pl.DataFrame, time: pl.DataFrame):
         # Get max/min timestamp for both Dataframes
-        min_t = time.select(pl.col("time")).min()[0, 0]
-        max_t = time.select(pl.col("time")).max()[0, 0]
-        min_d = data.select(pl.col("time")).min()[0, 0]
-        max_d = data.select(pl.col("time")).max()[0, 0]
+        min_t = time.select(_TIME).min()[0, 0]
+        max_t = time.select(_TIME).max()[0, 0]
+        min_d = data.select(_TIME).min()[0, 0]
+        max_d = data.select(_TIME).max()[0, 0]
         clip_low = max(min_t, min_d)
         clip_up = min(max_t, max_d)
 
@@ -206,9 +299,58 @@ class OdisiResult:
         time : pl.DataFrame
             The interpolated timestamp as dataframe.
 
+        Notes
+        -----
+        The interpolation is linear with respect to the actual timestamps.
+        Timestamps outside the measured time range are assigned the first or
+        last measured value, respectively.
+
         """
-        data = self._data
+        df_sync, time, rate = self._interpolate_pure(
+            self._data, time, clip=clip, relative_time=relative_time
+        )
+
+        # Update rate and data
+        self._rate = rate
+        self._data = df_sync
+        self._time_cache = None
+
+        return time
 
+    def _interpolate_pure(
+        self,
+        data: pl.DataFrame,
+        time: NDArray[np.datetime64] | pl.DataFrame,
+        clip: bool = False,
+        relative_time: bool = False,
+    ) -> tuple[pl.DataFrame, pl.DataFrame, float]:
+        """Interpolate `data` at the given timestamps without mutating state.
+
+        This is the functional core of `interpolate`: it does not touch the
+        instance, so several channels can be processed concurrently (e.g.
+        with `concurrent.futures`) and the results assigned afterwards.
+
+        Parameters
+        ----------
+        data : pl.DataFrame
+            Sensor data with a leading `time` column.
+        time : NDArray[datetime64] | pl.DataFrame
+            The target timestamps (see `interpolate`).
+        clip : bool (False)
+            See `interpolate`.
+        relative_time : bool (False)
+            See `interpolate`.
+
+        Returns
+        -------
+        df_sync : pl.DataFrame
+            The interpolated sensor data.
+        time : pl.DataFrame
+            The (possibly converted and clipped) target timestamps.
+        rate : float
+            The new measurement rate in Hz.
+
+        """
         # Ensure the correct name for the column
         if isinstance(time, pl.DataFrame):
             time = time.rename({time.columns[0]: "time"})
@@ -216,12 +358,21 @@ class OdisiResult:
         else:
             time = pl.DataFrame({"time": time})
 
+        # Ensure both time axes are increasing and mark them as sorted, so
+        # that Polars can take the sorted fast paths in subsequent operations
+        time = time.sort("time").set_sorted("time")
+        data = data.sort("time").set_sorted("time")
+
         # Consider relative time data
         if relative_time:
-            # Get initial timestamp from sensor data
-            t_init = data[0, 0]
+            # Get initial timestamp from sensor data as integer microseconds,
+            # so that the whole conversion stays in integer arithmetic and no
+            # Python datetime/timedelta objects are involved
+            t_init = data.get_column("time").to_physical()[0]
             time = time.select(
-                ((pl.col("time") * 1e6).cast(pl.Duration("us"))).add(t_init).alias("time")
+                ((_TIME * 1e6).cast(pl.Int64) + t_init)
+                .cast(pl.Datetime("us"))
+                .alias("time")
             )
 
         # Clip the data if requested
@@ -230,28 +381,34 @@ class OdisiResult:
             clip_low, clip_up = self.clip_time(data, time)
             # Filter the data
             time = time.filter(
-                (pl.col("time") >= clip_low) & (pl.col("time") <= clip_up)
+                (_TIME >= clip_low) & (_TIME <= clip_up)
             )
             data = data.filter(
-                (pl.col("time") >= clip_low) & (pl.col("time") <= clip_up)
+                (_TIME >= clip_low) & (_TIME <= clip_up)
             )
 
-        # Do the interpolation
-        aux, _ = pl.align_frames(data, time, on="time")
-
-        # Interpolate data
-        df_sync = aux.interpolate()
-
-        # Now get only the data associated to the load data
-        ix_load = [k[0] in time[:, 0] for k in df_sync.select("time").iter_rows()]
-        df_sync = df_sync.filter(ix_load)
+        # Interpolate each data column at the target timestamps. The
+        # interpolation is done directly on the integer (nanosecond)
+        # timestamps, i.e. it is weighted by the actual time between samples.
+        t_data = data.get_column("time").to_numpy().astype("datetime64[ns]").view(np.int64)
+        t_new = time.get_column("time").to_numpy().astype("datetime64[ns]").view(np.int64)
+
+        # Shift the time origin to the first sample, so that the timestamps
+        # remain exactly representable once converted to floats.
+        t_ref = t_data[0]
+        # Take the column names from the same frame the values come from, so
+        # that they stay in sync even when the time column is not first
+        y_frame = data.drop("time")
+        y_new = interp_columns(t_new - t_ref, t_data - t_ref, y_frame.to_numpy())
+
+        df_sync = time.select(_TIME).hstack(
+            pl.from_numpy(y_new, schema=y_frame.columns)
+        )
 
-        # Update rate
-        self._rate = (df_sync[1, 0] - df_sync[0, 0]).total_seconds()
-        # Update data
-        self._data = df_sync
+        # New rate (in Hz, directly from the nanosecond timestamps)
+        rate = 1e9 / (t_new[1] - t_new[0])
 
-        return time
+        return df_sync, time, rate
 
     def interpolate_signal(
         self,
@@ -295,15 +452,21 @@ class OdisiResult:
         else:
             data = pl.DataFrame({"time": time, "signal": signal})
 
+        # Ensure both time axes are increasing and mark them as sorted, so
+        # that Polars can take the sorted fast paths in subsequent operations
+        data = data.sort("time").set_sorted("time")
+        data_sensor = data_sensor.sort("time").set_sorted("time")
+
         # Consider relative time data
         if relative_time:
-            # Get initial timestamp from sensor data
-            t_init = data_sensor[0, 0]
-            # data = data.with_columns(
-            #     pl.col("time").map_elements(timedelta_sec).add(t_init)
-            # )
+            # Get initial timestamp from sensor data as integer microseconds,
+            # so that the whole conversion stays in integer arithmetic and no
+            # Python datetime/timedelta objects are involved
+            t_init = data_sensor.get_column("time").to_physical()[0]
             data = data.with_columns(
-                ((pl.col("time") * 1e6).cast(pl.Duration("us"))).add(t_init).alias("time")
+                ((_TIME * 1e6).cast(pl.Int64) + t_init)
+                .cast(pl.Datetime("us"))
+                .alias("time")
             )
 
         # Clip the data if requested
@@ -312,25 +475,29 @@ class OdisiResult:
             clip_low, clip_up = self.clip_time(data_sensor, data)
             # Filter the data
             data_sensor = data_sensor.filter(
-                (pl.col("time") >= clip_low) & (pl.col("time") <= clip_up)
+                (_TIME >= clip_low) & (_TIME <= clip_up)
             )
             data = data.filter(
-                (pl.col("time") >= clip_low) & (pl.col("time") <= clip_up)
+                (_TIME >= clip_low) & (_TIME <= clip_up)
             )
 
-        # Do the interpolation
-        _, aux = pl.align_frames(data_sensor, data, on="time")
-
-        # Interpolate data
-        df_sync = aux.interpolate()
-
-        sensor_time = data_sensor.select(pl.col("time"))
-
-        # Now get only the data associated to the load data
-        ix_load = [
-            k[0] in sensor_time[:, 0] for k in df_sync.select("time").iter_rows()
-        ]
-        df_sync = df_sync.filter(ix_load)
+        # Interpolate the signal at the sensor timestamps with the shared
+        # kernel, weighting by the actual time between samples (see
+        # `interpolate`).
+        t_signal = data.get_column("time").to_numpy().astype("datetime64[ns]").view(np.int64)
+        t_sensor = data_sensor.get_column("time").to_numpy().astype("datetime64[ns]").view(np.int64)
+
+        # Shift the time origin to the first sample, so that the timestamps
+        # remain exactly representable once converted to floats.
+        t_ref = t_signal[0]
+        # Take the column names from the same frame the values come from, so
+        # that they stay in sync even when the time column is not first
+        y_frame = data.drop("time")
+        y_new = interp_columns(t_sensor - t_ref, t_signal - t_ref, y_frame.to_numpy())
+
+        df_sync = data_sensor.select(_TIME).hstack(
+            pl.from_numpy(y_new, schema=y_frame.columns)
+        )
 
         return df_sync
 
@@ -419,6 +586,8 @@ class OdisiResult:
 class OdisiGagesResult(OdisiResult):
     """Docstring ."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         data,
@@ -437,4 +606,8 @@ class OdisiGagesResult(OdisiResult):
         """
         super().__init__(data, x, metadata)
         self._gages = gages
-        self._segments = segments
+        # Normalize the (start, end) column ranges to contiguous index
+        # arrays, which can be used directly for positional slicing
+        self._segments = {
+            k: np.arange(s, e + 1, dtype=np.int32) for k, (s, e) in segments.items()
+        }
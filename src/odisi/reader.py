@@ -3,26 +3,56 @@ from pathlib import Path
 
 import numpy as np
 import polars as pl
-import polars.selectors as cs
 
-from odisi.odisi import OdisiGagesResult, OdisiResult
+from odisi._cache import load_cached, store_cached
+from odisi.odisi import OdisiGagesResult, OdisiMetadata, OdisiResult
 
+# Columns corresponding to a segment have the following format: id[number].
+# Gages only contain the name (without the bracket + number). The first
+# pattern will only find gages and will exclude segments; the second one
+# extracts the individual segment id's.
+_PATTERN_GAGE = re.compile(r"[\w ]+(?!\[\d+\])")
+_PATTERN_SEGMENT = re.compile(r"(.*)\[\d+\]")
 
-def read_tsv(path: str | Path) -> OdisiResult:
+
+def read_tsv(path: str | Path, cache: bool = False) -> OdisiResult:
     """Read the exported TSV file.
 
     Parameters
     ----------
     path : str
         Path to the file.
+    cache : bool (False)
+        Whether the parsed data should be cached in Parquet sidecar files
+        next to the TSV file. Subsequent reads with `cache=True` reuse the
+        cache instead of re-parsing the file, as long as the file itself
+        has not changed.
 
     Returns
     -------
     odisi : obj:`OdisiResult`
 
     """
+    path = Path(path)
+
+    if cache:
+        cached = load_cached(path)
+        if cached is not None:
+            df, x, payload = cached
+            metadata = OdisiMetadata.from_raw(payload["metadata"])
+            if payload["with_gages"]:
+                return OdisiGagesResult(
+                    data=df,
+                    x=x,
+                    gages=payload["gages"],
+                    segments=payload["segments"],
+                    metadata=metadata,
+                )
+            return OdisiResult(data=df, x=x, metadata=metadata)
+
     info = []
     with_gages = False
+    labels = []
 
     with open(path, "r") as f:
         # Initialize counter for the lines
@@ -38,65 +68,73 @@ def read_tsv(path: str | Path) -> OdisiResult:
             else:
                 # Read next line after the end of the metadata to determine
                 # whether the file contains gages/segments or not.
-                seg = f.readline().strip()
+                seg = f.readline()
                 if seg[:12] == "Gage/Segment":
                     with_gages = True
+                    # Get the labels directly from this line, instead of
+                    # re-opening and re-scanning the file later. Remove the
+                    # first three items, as these don't correspond to labels.
+                    labels = seg.rstrip("\n").split("\t")[3:]
+                    # Skip the tare line
+                    f.readline()
+                # Without gages `seg` already was the tare line. In both
+                # cases the x-coordinates follow next.
+                line_x = f.readline()
                 break
 
     # Initialize dictionary to store metadata
-    metadata = {}
+    raw_metadata = {}
 
     for k in info:
-        metadata[k[0].strip()] = k[1].strip()
+        raw_metadata[k[0].strip()] = k[1].strip()
+
+    # Parse the typed metadata fields once
+    metadata = OdisiMetadata.from_raw(raw_metadata)
 
     if with_gages:
         n_skip = n_meta + 3
     else:
         n_skip = n_meta + 2
 
-    # Read data from optical sensor
-    df = pl.read_csv(
+    # Get the x-coordinates, parsed directly from the header line read above
+    # (the first three fields don't correspond to coordinates)
+    x = np.fromstring(line_x.split("\t", 3)[3], sep="\t")
+
+    # The number of columns is known from the x-coordinate line, so the
+    # full schema can be given up front: the data columns are parsed
+    # straight into floats and the timestamp into a Datetime, and the
+    # schema-inference pass over the head of the file is skipped entirely.
+    n_cols = len(x) + 3
+    schema = {
+        "column_1": pl.Datetime("us"),
+        "column_2": pl.String,
+        "column_3": pl.String,
+    }
+    schema.update({f"column_{i}": pl.Float64 for i in range(4, n_cols + 1)})
+
+    # Read data from optical sensor lazily, so that the projection (only the
+    # time and data columns) is pushed into a single optimized pass over
+    # the file
+    lf = pl.scan_csv(
         path,
         has_header=False,
         skip_rows=n_skip,
         separator="\t",
-        try_parse_dates=True,
+        schema=schema,
     )
 
-    # Rename time column
-    time = df.rename({df.columns[0]: "time"}).select(pl.col("time"))
-
-    # Cast as floats
-    data = df[:, 3:].with_columns(cs.all().cast(float))
-    # We only use the time and data columns (not the strain and measurement ones)
-    df = pl.concat([time, data], how="horizontal")
-
-    # Get line number to read x-coordinate, tare and gages/segments information
-    line_x = 3 if with_gages else 2
-
-    # Read data for: x-coordinate, tare and gages/segments (if available)
-    t = pl.read_csv(
-        path,
-        skip_rows=n_meta,
-        n_rows=line_x,
-        separator="\t",
-        has_header=False,
+    # We only use the time and data columns (not the strain and measurement
+    # ones)
+    df = (
+        lf.rename({"column_1": "time"})
+        .select(
+            pl.col("time"),
+            pl.nth(range(3, n_cols)),
+        )
+        .collect()
     )
-    # Get the x-coordinates
-    x = t[-1, 3:].select(pl.all().cast(float)).to_numpy()[0]
 
     if with_gages:
-        # Only read the names of the segments and gages.
-        with open(path, "r") as f:
-            for k, line in enumerate(f):
-                if k == n_meta:
-                    # Get labels. Remove the first three items, as these don't
-                    # correspond to labels.
-                    labels = line.split("\t")[3:]
-                    break
-            else:
-                raise LookupError("Labels not found.")
-
         # Get names and indices of gages
         gages = get_gages(labels)
         # Get names and indices of segments
@@ -106,8 +144,13 @@ def read_tsv(path: str | Path) -> OdisiResult:
             data=df, x=x, gages=gages, segments=segments, metadata=metadata
         )
     else:
+        gages = {}
+        segments = {}
         result = OdisiResult(data=df, x=x, metadata=metadata)
 
+    if cache:
+        store_cached(path, df, x, metadata.raw, with_gages, gages, segments)
+
     return result
 
 
@@ -126,16 +169,12 @@ def get_gages(all_labels: list[str]) -> dict[str, int]:
         of the column in the dataframe containing the sensor data.
 
     """
-    # Columns corresponding to a segment have the following format: id[number]
-    # Gages only contain the name (without the bracket + number). The next
-    # regular pattern will only find gages and will exclude segments.
-    pattern_id = re.compile(r"[\w ]+(?!\[\d+\])")
     # Initialize dictionary to map labels to column numbers
     gages = {}
     # Match each column name against the pattern until no match is found (the
     # gages are always at the beginning, followed by the segments).
     for ix, k in enumerate(all_labels):
-        m = pattern_id.match(k)
+        m = _PATTERN_GAGE.match(k)
         if m:
             # The '+ 1' is needed to consider the first column used for the
             # timestamp.
@@ -161,26 +200,18 @@ def get_segments(all_labels: list[str]) -> dict[str, tuple[int, int]]:
         for each segment.
 
     """
-    # Columns corresponding to a gage have the following format: id[number]
-    # We will search for this format and extract the individual id's first.
-    pattern_id = re.compile(r"(.*)\[\d+\]")
-
-    # Match each column name against the pattern (returns an iterator of Match
-    # objects)
-    ch_match = (pattern_id.match(k) for k in all_labels)
-
-    # Now get the individual id's
-    labels = np.unique([k.group(1) for k in ch_match if k]).tolist()
-
-    segments = {}
-
-    for s in labels:
-        # Create a new pattern to find the indices of the current segment
-        pattern_ix = re.compile(rf"{s}(?=\[\d+\])")
-        # Match each column against the pattern
-        match = (pattern_ix.match(k) for k in all_labels)
-        # Retrieve the indices corresponding to the current segment
-        s_ix = [int(k) + 1 for k, m in enumerate(match) if m]
-        segments[s] = (s_ix[0], s_ix[-1])
+    # Bucket the column indices by segment id in a single pass over the
+    # labels, instead of re-scanning (and re-compiling a pattern) per segment.
+    indices: dict[str, list[int]] = {}
+
+    for ix, k in enumerate(all_labels):
+        m = _PATTERN_SEGMENT.match(k)
+        if m:
+            # The '+ 1' is needed to consider the first column used for the
+            # timestamp.
+            indices.setdefault(m.group(1), []).append(ix + 1)
+
+    # Keep the segments sorted by label
+    segments = {s: (s_ix[0], s_ix[-1]) for s, s_ix in sorted(indices.items())}
 
     return segments
@@ -0,0 +1,25 @@
+import shutil
+
+from numpy.testing import assert_array_equal
+
+from odisi import read_tsv
+
+
+class TestCache:
+    def test_cache_roundtrip(self, tmp_path):
+        tsv = tmp_path / "data.tsv"
+        shutil.copy("tests/data/verification_data_ch1_gages.tsv", tsv)
+
+        first = read_tsv(tsv, cache=True)
+        # Check that the sidecar files were created
+        assert (tmp_path / "data.tsv.parquet").exists()
+        assert (tmp_path / "data.tsv.meta.json").exists()
+
+        # The second read should be served from the cache and yield the
+        # same result
+        second = read_tsv(tsv, cache=True)
+        assert second.data.equals(first.data)
+        assert_array_equal(second.x, first.x)
+        assert second.gages == first.gages
+        assert second.segments == first.segments
+        assert second.rate == first.rate
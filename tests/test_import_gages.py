@@ -1,4 +1,3 @@
-import pdb
 from datetime import datetime
 
 import numpy as np
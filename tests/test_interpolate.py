@@ -21,11 +21,11 @@ class TestInterpolation:
         time = data_time.select(["time [s]"])[::2]
         luna_data.interpolate(time)
         interp_data = luna_data.data
-        r = [-0.9, 0.8, 4.1, 4.0, 7.4333333]
+        r = [0.19419541, 1.94393157, 5.89050158, 4.74604233, 5.85835509]
         # Assert the correctness of the interpolation
         assert_almost_equal(interp_data[3, 1:6].to_numpy()[0], r)
         # Assert the new rate
-        assert luna_data.rate == 0.4
+        assert luna_data.rate == 2.5
 
     def test_interp_time_array(self, luna_data):
         data_time = pl.read_csv(
@@ -35,11 +35,11 @@ class TestInterpolation:
         time = data_time.select(["time [s]"]).to_series().to_numpy()[::2]
         luna_data.interpolate(time)
         interp_data = luna_data.data
-        r = [-0.9, 0.8, 4.1, 4.0, 7.4333333]
+        r = [0.19419541, 1.94393157, 5.89050158, 4.74604233, 5.85835509]
         # Assert the correctness of the interpolation
         assert_almost_equal(interp_data[3, 1:6].to_numpy()[0], r)
         # Assert the new rate
-        assert luna_data.rate == 0.4
+        assert luna_data.rate == 2.5
 
     def test_interp_time_relative(self, luna_data):
         data_time = pl.read_csv(
@@ -49,11 +49,11 @@ class TestInterpolation:
         time = data_time.select(["time [s]"]).to_series().to_numpy()[::2]
         luna_data.interpolate(time, relative_time=True)
         interp_data = luna_data.data
-        r = [-0.9, 0.8, 4.1, 4.0, 7.4333333]
+        r = [0.19419541, 1.94393157, 5.89050158, 4.74604233, 5.85835509]
         # Assert the correctness of the interpolation
         assert_almost_equal(interp_data[3, 1:6].to_numpy()[0], r)
         # Assert the new rate
-        assert luna_data.rate == 0.4
+        assert luna_data.rate == 2.5
 
     def test_interp_signal_time_relative(self, luna_data):
         data_time = pl.read_csv(
@@ -63,7 +63,7 @@ class TestInterpolation:
         new_signal = luna_data.interpolate_signal(
             data_time, time="time [s]", relative_time=True
         )
-        r = [0.00265, 0.001765, -0.00054, 0.000285, -0.004265]
+        r = [0.00265, -0.00157427, -0.00257075, -0.00394948, -0.00739019]
         # Assert the correctness of the interpolation
         assert_almost_equal(new_signal[:5, 1], r)
 
@@ -71,10 +71,20 @@ class TestInterpolation:
         signal = pl.read_csv("tests/data/verification_load.csv", try_parse_dates=True)
 
         new_signal = luna_data.interpolate_signal(data=signal, time="time [s]")
-        r = [0.00265, 0.001765, -0.00054, 0.000285, -0.004265]
+        r = [0.00265, -0.00157427, -0.00257075, -0.00394948, -0.00739019]
         # Assert the correctness of the interpolation
         assert_almost_equal(new_signal[:5, 1].to_numpy(), r)
 
+    def test_interp_signal_time_not_first(self, luna_data):
+        signal = pl.read_csv("tests/data/verification_load.csv", try_parse_dates=True)
+        # The time column doesn't need to be the first column of the dataframe
+        reordered = signal.select(signal.columns[1:] + signal.columns[:1])
+
+        new_signal = luna_data.interpolate_signal(data=reordered, time="time [s]")
+        expected = luna_data.interpolate_signal(data=signal, time="time [s]")
+        # Assert that the result is independent of the column order
+        assert new_signal.equals(expected)
+
     def test_interp_time_array_clip(self, luna_data):
         data_time = pl.read_csv(
             "tests/data/verification_load.csv", try_parse_dates=True
@@ -83,7 +93,7 @@ class TestInterpolation:
         time = data_time.select(["time [s]"])[::2]
         new_time = luna_data.interpolate(time, clip=True)
         interp_data = luna_data.data
-        r = [-0.9, 0.8, 4.1, 4.0, 7.4333333]
+        r = [0.19419541, 1.94393157, 5.89050158, 4.74604233, 5.85835509]
         # Assert the correctness of the interpolation
         assert_almost_equal(interp_data[3, 1:6].to_numpy()[0], r)
         # Assert the new rate
@@ -18,6 +18,14 @@ class TestGages:
         assert p[0, 1] == 3.7
         assert p[0, 0] == datetime.fromisoformat("2023-09-06 12:51:28.888946")
 
+    def test_gage_lazy(self):
+        p = DATA_GAGES.get_gage("Start", lazy=True)
+        assert p.collect().equals(DATA_GAGES.get_gage("Start"))
+
+    def test_gage_lazy_time(self):
+        p = DATA_GAGES.get_gage("Start", with_time=True, lazy=True)
+        assert p.collect().equals(DATA_GAGES.get_gage("Start", with_time=True))
+
     def test_gages(self):
         p = DATA_GAGES.gages
         r = [
@@ -56,6 +64,18 @@ class TestSegments:
         assert p[0, 1] == 3.7
         assert p[0, 0] == datetime.fromisoformat("2023-09-06 12:51:28.888946")
 
+    def test_segment_lazy(self):
+        p, x = DATA_GAGES.get_segment("B2", lazy=True)
+        p_eager, x_eager = DATA_GAGES.get_segment("B2")
+        assert p.collect().equals(p_eager)
+        assert_array_equal(x, x_eager)
+
+    def test_segment_lazy_time(self):
+        p, x = DATA_GAGES.get_segment("B2", with_time=True, lazy=True)
+        p_eager, x_eager = DATA_GAGES.get_segment("B2", with_time=True)
+        assert p.collect().equals(p_eager)
+        assert_array_equal(x, x_eager)
+
     def test_x_coordinate_along_sensor(self):
         p, x = DATA_GAGES.get_segment("B2", x_along_sensor=True)
         d = p.to_numpy()[0, -5:]